@@ -15,3 +15,4 @@ Usage:
 """
 
 from .api import BulkSMS
+from .aio import BulkSMSAsync
@@ -0,0 +1,188 @@
+"""Asynchronous client to deliver SMS messages through BulkSMS.com.
+
+Requests issued concurrently share one connection pool, so fanning out to many
+recipients or polling delivery status for many message IDs proceeds at pool
+speed instead of one round-trip per call.
+
+Requires the optional aiohttp package (pip install bulksms[async]).
+
+Usage:
+
+.. code-block:: python
+    import asyncio
+    from bulksms.aio import BulkSMSAsync
+
+    async def main():
+        async with BulkSMSAsync(token_id='17A7C58921F54B5899D5C1237FCCD5FA-02-F', token_secret='9Sj8Ae9WQhBMEI2eMGXIKpZHC8shq') as bsms:
+            msgids = await bsms.send(['+1535989656', '+4985656335'], "Happy birthday! Glückwunsch!", priority=True)
+            print(await bsms.gather_msg_status(msgids))
+
+    asyncio.run(main())
+"""
+
+import asyncio
+import logging
+from typing import Optional, Mapping, Iterable, Union, Any
+
+try:
+    import aiohttp
+except ImportError:                                         # pragma: no cover
+    aiohttp = None
+
+from bulksms.api import BulkSMS, json_dumps, json_loads, is_gsm7, encode_send_params, _get_id, _STATUS_SENT_QS
+from bulksms.utils import normalize_recipient
+
+log = logging.getLogger(__name__)
+
+class BulkSMSAsync(BulkSMS):
+    """Asynchronous variant of :class:`bulksms.api.BulkSMS`.
+
+    Offers the same interface with coroutine methods, plus helpers to fan out
+    many requests concurrently. Use as an async context manager, or call
+    'await close()' when done, to release the connection pool.
+    """
+
+    def __init__(self, token_id: Optional[str]=None, token_secret: Optional[str]=None, username: Optional[str]=None, password: Optional[str]=None, sender: Optional[str]=None, routing_group: Optional[str]=None):
+        """Initialize the object.
+
+        :param token_id:		Token name, if token access is used.
+        :param token_secert:	Token secret, if token access is used.
+        :param username:		Username, if login is used.
+        :param password:		Password, if login is used.
+        :param sender:			Sender ID to use as From when sending messages, number or alphanumeric; must be pre-configured in BulkSMS account.
+        :param routing_group:	Name of the routing group (priority) to use, in { 'ECONOMY', 'STANDARD', 'PREMIUM' }. See https://www.bulksms.com/pricing/sms-routing.htm .
+
+        :raises ValueError:		Authentication data is lacking, invalid routing_group, or aiohttp is not installed.
+        """
+        if aiohttp is None:
+            raise ValueError("BulkSMSAsync requires the aiohttp package (pip install bulksms[async]).")
+        super().__init__(token_id=token_id, token_secret=token_secret, username=username, password=password, sender=sender, routing_group=routing_group)
+        self._session = None
+
+    def get_session(self) -> 'aiohttp.ClientSession':
+        """Return the shared HTTP session, creating it on first use.
+
+        :return:	Session shared by all requests of this object."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300))
+        return self._session
+
+    async def close(self) -> None:
+        """Release the connection pool held by the session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def __aenter__(self) -> 'BulkSMSAsync':
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    def __del__(self):
+        if getattr(self, '_session', None) is not None and not self._session.closed:
+            log.warning("BulkSMSAsync deleted without closing; call 'await close()' or use 'async with'.")
+
+    async def do_send(self, url: str, content: bytes=b'', method: str='GET', js: Optional[Any]=None) -> Any:
+        """Low-level interface to send a raw message to the BulkSMS API endpoint.
+
+        :param url:			URL to send the request to.
+        :param content:		Raw content to send.
+        :param method:		HTTP method to query endpoint with.
+        :param js:			Any JSON object to send; if given along with 'content', then it's appended to it.
+
+        :return:			The JSON data returned by BulkSMS' JSON endpoint.
+        """
+        headers = self.get_headers()
+        if js is not None:
+            content = (content + json_dumps(js)) if content else json_dumps(js)
+        method = method.upper()
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Sending %s to %s with %s", method, url, content)
+        session = self.get_session()
+        try:
+            async with session.request(method, url, data=content or None, headers=headers, timeout=aiohttp.ClientTimeout(total=self.timeout_s)) as resp:
+                resp.raise_for_status()
+                return json_loads(await resp.read())
+        except aiohttp.ClientError as e:
+            log.error("Error submitting request to %s: %s", url, e)
+            raise
+
+    async def send(self, recipients: Union[str,Iterable[str]], content: str, sender: Optional[str]=None, priority: bool=False) -> Iterable[str]:
+        """Send message to some recipients.
+
+        See :meth:`bulksms.api.BulkSMS.send` for details.
+
+        :param recipients:	Recipient(s) to deliver to, either as mobile number or alphanumeric name.
+        :param content:		Text of the message to send; may contain UTF-8 characters.
+        :param sender:		Sender ID to override the session-default Sender ID, used if this is left unset.
+        :param priority:	Whether the message should be sent requesting the top priority routing, or with the session-default routing priority.
+
+        :raises aiohttp.ClientError:   Failure communicating with BulkSMS' API.
+
+        :return:			List with one message ID for each respective recipient.
+        """
+        if isinstance(recipients, str):
+            recipients = [recipients]
+        recipients = list(map(normalize_recipient, recipients))
+        enc_type = 'TEXT' if is_gsm7(content) else 'UNICODE'
+        params = {
+            'to': recipients,
+            'encoding': enc_type,
+            'body': content,
+        }
+        rgroup = self.get_routing_group(priority)
+        if rgroup is not None:
+            params['routingGroup'] = rgroup
+        if sender or self.sender:
+            params['from'] = normalize_recipient(sender) if sender else self.sender
+        try:
+            res = await self.do_send(self._messages_url, content=encode_send_params(params), method='POST')
+        except Exception as e:
+            log.error("Message to %s failed to send: %s", recipients, e)
+            raise
+        log.debug("Message to %s successfully sent: %s", recipients, res)
+        return list(map(_get_id, res))
+
+    async def msg_status(self, message_id: str) -> Iterable[Mapping[str, Any]]:
+        """Return raw message delivery status.
+
+        :param message_id:   ID to get delivery status for.
+
+        :return:        Status as described by BulkSMS API"""
+        return await self.do_send(self._messages_url + '/' + message_id + _STATUS_SENT_QS)
+
+    async def gather_msg_status(self, message_ids: Iterable[str]) -> Iterable[Mapping[str, Any]]:
+        """Return raw delivery status for many messages, queried concurrently.
+
+        :param message_ids:  IDs to get delivery status for.
+
+        :return:        List with one status per respective message ID."""
+        return list(await asyncio.gather(*(self.msg_status(mid) for mid in message_ids)))
+
+    async def msg_delivery_status(self, message_id: str):
+        """Return delivery status in {'ACCEPTED', 'SCHEDULED', 'SENT', 'DELIVERED', 'FAILED'}.
+
+        :param message_id:   The message ID to look up delivery status for.
+
+        :raises ValueError:             Server response breached expected format.
+        :raises aiohttp.ClientError:    Failure communicating with BulkSMS' API.
+
+        :return:      Delivery status in {'ACCEPTED', 'SCHEDULED', 'SENT', 'DELIVERED', 'FAILED'}"""
+        res = await self.msg_status(message_id)
+        try:
+            return res['status']['type'].upper()
+        except (KeyError, IndexError, TypeError, ValueError) as err:
+            raise ValueError(f"Unable to parse result from server: '{res}'") from err
+
+    async def msg_cost(self, message_id: str) -> int:
+        """Return cost of message delivery in credits.
+
+        :param message_id:   The message ID to look up delivery status for.
+
+        :return:      The cost of the message in number of credits.
+        """
+        res = await self.msg_status(message_id)
+        try:
+            return float(res['creditCost'])
+        except (KeyError, IndexError, TypeError, ValueError) as err:
+            raise ValueError(f"Unable to parse result from server: '{res}'") from err
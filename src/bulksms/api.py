@@ -9,26 +9,124 @@ res = bsms.send(['+1535989656', '+4985656335'], "Happy birthday! Glückwunsch!",
 print(res)
 """
 
+import gzip
 import logging
 import json
 import base64
 import string
-from typing import Optional, Mapping, Iterable, Union, Any
+from json.encoder import encode_basestring_ascii as _esc
+from functools import lru_cache
+from operator import itemgetter
+from typing import Optional, Mapping, Iterable, Union, Any, Tuple
 
+import http.client
 import urllib.request
 import urllib.parse
 
+try:
+    import orjson
+except ImportError:                                         # pragma: no cover
+    orjson = None
+
+try:
+    import urllib3
+except ImportError:                                         # pragma: no cover
+    urllib3 = None
+
+try:
+    import httpx
+except ImportError:                                         # pragma: no cover
+    httpx = None
+
+try:
+    import ijson
+except ImportError:                                         # pragma: no cover
+    ijson = None
+
 from bulksms.utils import getenv, normalize_recipient
 
 # See https://www.bulksms.com/pricing/sms-routing.htm
 ROUTING_GROUPS = [ 'ECONOMY', 'STANDARD', 'PREMIUM' ]
+_ROUTING_SET = frozenset(ROUTING_GROUPS)
+
+# 'pool' reuses connections across requests (requires urllib3), amortizing the TCP+TLS handshake;
+# 'http2' multiplexes concurrent requests over one TLS stream (requires httpx[http2]);
+# 'lowlevel' keeps one http.client connection, skipping urllib's handler-chain dispatch
+TRANSPORTS = [ 'urllib', 'pool', 'http2', 'lowlevel' ]
 
 # see https://www.etsi.org/deliver/etsi_gts/03/0338/05.00.00_60/gsmts_0338v050000p.pdf
 GSM_0338_7BIT_ALPHABET = set(string.ascii_letters + string.digits + "@£$¥èéùìòÇ\nØø\rÅåΔ_ΦΓΛΩΠΨΣΘΞ ÆæßÉ !\"#¤%&'()*+,-./:;<=>?¡ÄÖÑÜ`¿äöñüà")
 
-logging.basicConfig(level=logging.DEBUG)
 log = logging.getLogger(__name__)
 
+# extracts the message ID from one entry of a send() response
+_get_id = itemgetter('id')
+
+# constant query string selecting sent-message status, prebuilt once ('?filter=type%3DSENT')
+_STATUS_SENT_QS = '?' + urllib.parse.urlencode({'filter': urllib.parse.urlencode({'type': 'SENT'})})
+
+@lru_cache(maxsize=64)
+def _build_url(base: str, resource: str, params: Optional[Tuple[Tuple[str, str], ...]]=None) -> str:
+    """Construct a resource URL, memoizing recently built ones.
+
+    :param base:		API base URL.
+    :param resource:	Name of BulkSMS resource within BulkSMS API, e.g. 'messages'.
+    :param params:		Parameter names and values to append to the query string, as a hashable tuple of pairs.
+
+    :return:			Final URL with API base, resource, and parameters encoded.
+    """
+    url = base + '/' + resource.lstrip('/')
+    if params is None:
+        return url
+    return url + '?' + urllib.parse.urlencode(params)
+
+def encode_send_params(params: Mapping[str, Any]) -> bytes:
+    """Serialize send() parameters to JSON bytes with a schema-specialized encoder.
+
+    send() always emits a flat object of strings plus one list of strings, so
+    the object can be assembled directly with the C-accelerated string escaper,
+    skipping the generic serializer's type dispatch and dict walk. Output
+    matches json.dumps() byte for byte. Parameters outside that schema fall
+    back to the generic serializer.
+
+    :param params:  The send() parameters to serialize.
+
+    :return:        UTF-8 encoded JSON representation of the parameters.
+    """
+    parts = []
+    for key, val in params.items():
+        if isinstance(val, str):
+            sval = _esc(val)
+        elif isinstance(val, list) and all(isinstance(v, str) for v in val):
+            sval = '[' + ', '.join(map(_esc, val)) + ']'
+        else:
+            # schema evolved => defer to the generic serializer
+            return json_dumps(params)
+        parts.append(_esc(key) + ': ' + sval)
+    return ('{' + ', '.join(parts) + '}').encode()
+
+def json_dumps(js: Any) -> bytes:
+    """Serialize an object to JSON bytes, with orjson if available.
+
+    :param js:      The object to serialize.
+
+    :return:        UTF-8 encoded JSON representation of the object.
+    """
+    if orjson is not None:
+        return orjson.dumps(js)
+    return json.dumps(js).encode()
+
+def json_loads(data: bytes) -> Any:
+    """Parse JSON bytes into an object, with orjson if available.
+
+    :param data:    UTF-8 encoded JSON data to parse.
+
+    :return:        The object described by the JSON data.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode())
+
 def is_gsm7(text: str) -> bool:
     """Return whether a string is encodable with 7 bit in GSM.
     
@@ -36,7 +134,7 @@ def is_gsm7(text: str) -> bool:
     
     :return:        True iff the string can be encoded with the GSM7 alphabet.
     """
-    return not (set(text) - GSM_0338_7BIT_ALPHABET)
+    return GSM_0338_7BIT_ALPHABET.issuperset(text)
 
 class BulkSMS:
     """Holds an authenticated session with BulkSMS.com's JSON API.
@@ -47,17 +145,18 @@ class BulkSMS:
     api_base = 'https://api.bulksms.com/v1'
     timeout_s = 4
 
-    def __init__(self, token_id: Optional[str]=None, token_secret: Optional[str]=None, username: Optional[str]=None, password: Optional[str]=None, sender: Optional[str]=None, routing_group: Optional[str]=None):
+    def __init__(self, token_id: Optional[str]=None, token_secret: Optional[str]=None, username: Optional[str]=None, password: Optional[str]=None, sender: Optional[str]=None, routing_group: Optional[str]=None, transport: str='urllib'):
         """Initialize the object.
-        
+
         :param token_id:		Token name, if token access is used.
         :param token_secert:	Token secret, if token access is used.
         :param username:		Username, if login is used.
         :param password:		Password, if login is used.
         :param sender:			Sender ID to use as From when sending messages, number or alphanumeric; must be pre-configured in BulkSMS account.
         :param routing_group:	Name of the routing group (priority) to use, in { 'ECONOMY', 'STANDARD', 'PREMIUM' }. See https://www.bulksms.com/pricing/sms-routing.htm .
+        :param transport:		HTTP transport to use, in { 'urllib', 'pool', 'http2', 'lowlevel' }; 'pool' reuses connections across requests and is recommended for bulk workloads, but requires the optional urllib3 package; 'http2' additionally multiplexes requests over one connection, but requires the optional httpx package; 'lowlevel' keeps a single dependency-free http.client connection, suited to sequential bulk loops.
 
-        :raises ValueError:		Authentication data is lacking, or invalid routing_group.
+        :raises ValueError:		Authentication data is lacking, invalid routing_group, or unavailable transport.
         """
         if token_id is None and username is None:
             raise ValueError("Either token or username/password must be given.")
@@ -65,6 +164,13 @@ class BulkSMS:
             'username': username or token_id,
             'password': password or token_secret,
         }
+        astr = f"{self.login['username']}:{self.login['password']}"
+        self._base_headers = {
+            'Content-Type': 'application/json',
+            'Authorization': f'Basic {base64.b64encode(astr.encode()).decode()}',
+            'Accept-Encoding': 'gzip',
+            }
+        self._messages_url = self.api_base + '/messages'
         self.sender = None
         if sender is not None:
             self.sender = normalize_recipient(sender)
@@ -74,18 +180,29 @@ class BulkSMS:
             self.routing_group = getenv('BULKSMS_DEFAULT_ROUTING')
         if self.routing_group is not None:
             self.routing_group = self.routing_group.upper()
-            if self.routing_group not in ROUTING_GROUPS:
+            if self.routing_group not in _ROUTING_SET:
                 raise ValueError(f"Invalid routing_group '{routing_group}': valid choices are {ROUTING_GROUPS}")
+        if transport not in TRANSPORTS:
+            raise ValueError(f"Invalid transport '{transport}': valid choices are {TRANSPORTS}")
+        self._pool = None
+        self._client = None
+        self._conn = None
+        if transport == 'pool':
+            if urllib3 is None:
+                raise ValueError("Transport 'pool' requires the urllib3 package (pip install bulksms[pool]).")
+            self._pool = urllib3.PoolManager(num_pools=1, maxsize=16, block=False, timeout=self.timeout_s)
+        elif transport == 'http2':
+            if httpx is None:
+                raise ValueError("Transport 'http2' requires the httpx package (pip install bulksms[http2]).")
+            self._client = httpx.Client(http2=True, headers=self._base_headers, timeout=self.timeout_s)
+        elif transport == 'lowlevel':
+            self._conn = http.client.HTTPSConnection(urllib.parse.urlsplit(self.api_base).netloc, timeout=self.timeout_s)
 
     def get_headers(self) -> Mapping[str, str]:
-        """Generate generic request headers, e.g. with authentication data.
-        
+        """Return generic request headers, e.g. with authentication data.
+
         :return:	Map with HTTP header names to values."""
-        astr = f"{self.login['username']}:{self.login['password']}"
-        return {
-            'Content-Type': 'application/json',
-            'Authorization': f'Basic {base64.b64encode(astr.encode()).decode()}'
-            }
+        return self._base_headers
 
     def do_send(self, url: str, content: bytes=b'', method: str='GET', js: Optional[Any]=None) -> Any:
         """Low-level interface to send a raw message to the BulkSMS API endpoint.
@@ -99,21 +216,126 @@ class BulkSMS:
 
         :return:			The JSON data returned by BulkSMS' JSON endpoint.
         """
-        log.debug("Sending req to: %s", url)
-        headers= self.get_headers()
-        log.debug(headers)
+        headers = self.get_headers()
         if js is not None:
-            content += json.dumps(js).encode()
+            # avoid concat-copying when there is no preexisting content, which is the common case
+            content = (content + json_dumps(js)) if content else json_dumps(js)
         method = method.upper()
-        log.debug("Sending %s to %s with %s", method, url, content)
-        req = urllib.request.Request(url, method=method.upper(), data=content, headers=headers)
+        # do not log headers: they carry the Authorization credential
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Sending %s to %s with %s", method, url, content)
+        if self._pool is not None:
+            return self._do_send_pooled(url, content, method, headers)
+        if self._client is not None:
+            return self._do_send_http2(url, content, method)
+        if self._conn is not None:
+            return self._do_send_lowlevel(url, content, method, headers)
+        req = urllib.request.Request(url, method=method, data=content, headers=headers)
         try:
             with urllib.request.urlopen(req, timeout=self.timeout_s) as f:
-                return json.loads(f.read().decode())
+                data = f.read()
+                if f.headers.get('Content-Encoding') == 'gzip':
+                    data = gzip.decompress(data)
+                return json_loads(data)
         except Exception as e:
             log.error("Error submitting request to %s: %s", url, e)
             raise
 
+    def _do_send_pooled(self, url: str, content: bytes, method: str, headers: Mapping[str, str]) -> Any:
+        """Send a request over the reusable connection pool ('pool' transport).
+
+        :param url:			URL to send the request to.
+        :param content:		Raw content to send.
+        :param method:		HTTP method to query endpoint with.
+        :param headers:		HTTP headers to send along with the request.
+
+        :raises urllib.error.URLError:   Failure communicating with BulkSMS' API.
+
+        :return:			The JSON data returned by BulkSMS' JSON endpoint.
+        """
+        try:
+            resp = self._pool.request(method, url, body=content or None, headers=headers)
+        except urllib3.exceptions.HTTPError as e:
+            log.error("Error submitting request to %s: %s", url, e)
+            raise urllib.error.URLError(str(e)) from e
+        if resp.status >= 400:
+            log.error("Error submitting request to %s: HTTP %s %s", url, resp.status, resp.reason)
+            raise urllib.error.HTTPError(url, resp.status, resp.reason, resp.headers, None)
+        return json_loads(resp.data)
+
+    def _do_send_http2(self, url: str, content: bytes, method: str) -> Any:
+        """Send a request over the multiplexing HTTP/2 client ('http2' transport).
+
+        Authentication headers are held by the client itself, where HPACK
+        compresses them across requests.
+
+        :param url:			URL to send the request to.
+        :param content:		Raw content to send.
+        :param method:		HTTP method to query endpoint with.
+
+        :raises urllib.error.URLError:   Failure communicating with BulkSMS' API.
+
+        :return:			The JSON data returned by BulkSMS' JSON endpoint.
+        """
+        try:
+            resp = self._client.request(method, url, content=content or None)
+        except httpx.HTTPError as e:
+            log.error("Error submitting request to %s: %s", url, e)
+            raise urllib.error.URLError(str(e)) from e
+        if resp.status_code >= 400:
+            log.error("Error submitting request to %s: HTTP %s %s", url, resp.status_code, resp.reason_phrase)
+            raise urllib.error.HTTPError(url, resp.status_code, resp.reason_phrase, resp.headers, None)
+        return json_loads(resp.content)
+
+    def _do_send_lowlevel(self, url: str, content: bytes, method: str, headers: Mapping[str, str]) -> Any:
+        """Send a request over the cached http.client connection ('lowlevel' transport).
+
+        :param url:			URL to send the request to.
+        :param content:		Raw content to send.
+        :param method:		HTTP method to query endpoint with.
+        :param headers:		HTTP headers to send along with the request.
+
+        :raises urllib.error.URLError:   Failure communicating with BulkSMS' API.
+
+        :return:			The JSON data returned by BulkSMS' JSON endpoint.
+        """
+        parts = urllib.parse.urlsplit(url)
+        path = parts.path + ('?' + parts.query if parts.query else '')
+        try:
+            try:
+                self._conn.request(method, path, body=content or None, headers=headers)
+                resp = self._conn.getresponse()
+            except (http.client.BadStatusLine, ConnectionError):
+                # server dropped the idle connection => reconnect once
+                self._conn.close()
+                self._conn.request(method, path, body=content or None, headers=headers)
+                resp = self._conn.getresponse()
+            data = resp.read()
+        except (http.client.HTTPException, OSError) as e:
+            log.error("Error submitting request to %s: %s", url, e)
+            raise urllib.error.URLError(str(e)) from e
+        if resp.status >= 400:
+            log.error("Error submitting request to %s: HTTP %s %s", url, resp.status, resp.reason)
+            raise urllib.error.HTTPError(url, resp.status, resp.reason, resp.headers, None)
+        if resp.headers.get('Content-Encoding') == 'gzip':
+            data = gzip.decompress(data)
+        return json_loads(data)
+
+    def close(self) -> None:
+        """Release any network resources held by the session.
+
+        Only relevant for the 'pool', 'http2' and 'lowlevel' transports; a no-op otherwise."""
+        # getattr: __del__ may run on objects whose constructor raised
+        if getattr(self, '_pool', None) is not None:
+            self._pool.clear()
+        if getattr(self, '_client', None) is not None:
+            self._client.close()
+        if getattr(self, '_conn', None) is not None:
+            self._conn.close()
+
+    def __del__(self):
+        self.close()
+
     def get_url(self, resource: str, params: Optional[Mapping[str, str]]=None) -> str:
         """Construct the final URL for a given resource and with given parameters.
         
@@ -122,10 +344,9 @@ class BulkSMS:
 
         :return:			Final URL with API base, resource, and parameters encoded.
         """
-        url = self.api_base + '/' + resource.lstrip('/')
         if params is None:
-            return url
-        return url + '?' + urllib.parse.urlencode(params)
+            return _build_url(self.api_base, resource)
+        return _build_url(self.api_base, resource, tuple(sorted(params.items())))
 
     def get_sender(self, sender: str=None) -> str:
         """Configure the sender ID, or return the currently configured sender ID.
@@ -166,7 +387,7 @@ class BulkSMS:
         """
         if isinstance(recipients, str):
             recipients = [recipients]
-        recipients = [normalize_recipient(r) for r in recipients]
+        recipients = list(map(normalize_recipient, recipients))
         enc_type = 'TEXT' if is_gsm7(content) else 'UNICODE'
         params = {
             'to': recipients,
@@ -179,12 +400,12 @@ class BulkSMS:
         if sender or self.sender:
             params['from'] = normalize_recipient(sender) if sender else self.sender
         try:
-            res = self.do_send(self.get_url('messages'), js=params, method='POST')
+            res = self.do_send(self._messages_url, content=encode_send_params(params), method='POST')
         except Exception as e:
             log.error("Message to %s failed to send: %s", recipients, e)
             raise
         log.debug("Message to %s successfully sent: %s", recipients, res)
-        return [msg['id'] for msg in res]
+        return list(map(_get_id, res))
     
     def msg_status(self, message_id: str) -> Iterable[Mapping[str, Any]]:
         """Return raw message delivery status.
@@ -192,13 +413,7 @@ class BulkSMS:
         :param message_id:   ID to get delivery status for.
         
         :return:        Status as described by BulkSMS API"""
-        filter_params = {
-            'type': 'SENT',
-        }
-        params = {
-            'filter': urllib.parse.urlencode(filter_params)
-        }
-        return self.do_send(self.get_url(f'messages/{message_id}', params))
+        return self.do_send(self._messages_url + '/' + message_id + _STATUS_SENT_QS)
 
     def msg_delivery_status(self, message_id: str):
         """Return delivery status in {'ACCEPTED', 'SCHEDULED', 'SENT', 'DELIVERED', 'FAILED'}.
@@ -215,6 +430,38 @@ class BulkSMS:
         except (KeyError, IndexError, TypeError, ValueError) as err:
             raise ValueError(f"Unable to parse result from server: '{res}'") from err
 
+    def msg_delivery_status_stream(self, message_id: str):
+        """Return delivery status, stream-parsing the server response.
+
+        Unlike :meth:`msg_delivery_status`, the status is extracted while the
+        response downloads, without buffering the whole payload in memory;
+        useful when the server returns large status histories.
+
+        Requires the optional ijson package (pip install bulksms[stream]).
+
+        :param message_id:   The message ID to look up delivery status for.
+
+        :raises ValueError:             Server response breached expected format, or ijson is not installed.
+        :raises urllib.error.URLError:   Failure communicating with BulkSMS' API.
+
+        :return:      Delivery status in {'ACCEPTED', 'SCHEDULED', 'SENT', 'DELIVERED', 'FAILED'}"""
+        if ijson is None:
+            raise ValueError("msg_delivery_status_stream() requires the ijson package (pip install bulksms[stream]).")
+        url = self._messages_url + '/' + message_id + _STATUS_SENT_QS
+        req = urllib.request.Request(url, headers=self.get_headers())
+        try:
+            with urllib.request.urlopen(req, timeout=self.timeout_s) as f:
+                stream = f
+                if f.headers.get('Content-Encoding') == 'gzip':
+                    # decompress incrementally; gzip.decompress would buffer the whole payload
+                    stream = gzip.GzipFile(fileobj=f)
+                for status_type in ijson.items(stream, 'status.type'):
+                    return status_type.upper()
+        except Exception as e:
+            log.error("Error submitting request to %s: %s", url, e)
+            raise
+        raise ValueError(f"Unable to parse result from server: no status type for message '{message_id}'")
+
     def msg_cost(self, message_id: str) -> int:
         """Return cost of message delivery in credits.
         
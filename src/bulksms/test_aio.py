@@ -0,0 +1,66 @@
+"""Testing logic for BulkSMS asynchronous API"""
+
+import json
+import unittest
+from unittest import mock
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from bulksms.aio import BulkSMSAsync
+
+class BulkSMSAsyncConstructionTest(unittest.TestCase):
+
+    """Test cases for BulkSMSAsync construction"""
+
+    @unittest.skipIf(aiohttp, "aiohttp installed")
+    def test_constructor_fails_missing_aiohttp(self):
+        """Constructor raises if aiohttp is not installed"""
+        with self.assertRaises(ValueError) as err:
+            BulkSMSAsync('tokid', 'tokpass')
+        self.assertIn('aiohttp', str(err.exception))
+
+    @unittest.skipUnless(aiohttp, "aiohttp not installed")
+    def test_constructor_fails_missing_auth(self):
+        """Constructor raises if authentication data is not provided"""
+        with self.assertRaises(ValueError) as err:
+            BulkSMSAsync()
+        self.assertIn('token', str(err.exception))
+        self.assertIn('username', str(err.exception))
+
+
+@unittest.skipUnless(aiohttp, "aiohttp not installed")
+class BulkSMSAsyncTest(unittest.IsolatedAsyncioTestCase):
+
+    """Test cases for BulkSMSAsync object"""
+
+    async def test_send_interface(self):
+        """send() POSTs to messages endpoint and collects message IDs"""
+        bsms = BulkSMSAsync('ti', 'ts')
+        with mock.patch.object(bsms, 'do_send', new=mock.AsyncMock(return_value=[{"id": "68953asd"}])) as mds:
+            res = await bsms.send(['1234'], 'My msg')
+            self.assertEqual(['68953asd'], res)
+            self.assertEqual(1, mds.call_count)
+            self.assertEqual('POST', mds.call_args.kwargs['method'])
+            jdata = json.loads(mds.call_args.kwargs['content'].decode())
+            self.assertEqual(["+1234"], jdata['to'])
+
+    async def test_gather_msg_status_queries_each_id(self):
+        """gather_msg_status() returns one status per message ID"""
+        bsms = BulkSMSAsync('ti', 'ts')
+        with mock.patch.object(bsms, 'msg_status', new=mock.AsyncMock(return_value={'status': {'type': 'SENT'}})) as mms:
+            res = await bsms.gather_msg_status(['1', '2', '3'])
+            self.assertEqual(3, len(res))
+            self.assertEqual(3, mms.call_count)
+
+    async def test_msg_delivery_status_parses_response(self):
+        """msg_delivery_status() extracts status type from API response"""
+        bsms = BulkSMSAsync('ti', 'ts')
+        with mock.patch.object(bsms, 'do_send', new=mock.AsyncMock(return_value={'status': {'type': 'DELIVERED'}})):
+            self.assertEqual('DELIVERED', await bsms.msg_delivery_status('5544332211'))
+
+
+if __name__ == '__main__':
+    unittest.main()         # pragma: no cover
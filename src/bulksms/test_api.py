@@ -1,14 +1,39 @@
 """Testing logic for BulkSMS API"""
 
+import gzip
+import io
 import json
 import unittest
 import os
+import http.client
 import urllib.error
 import urllib.request
 import base64
 from unittest import mock
 
-from bulksms.api import BulkSMS, ROUTING_GROUPS
+try:
+    import urllib3
+except ImportError:
+    urllib3 = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+from bulksms.api import BulkSMS, ROUTING_GROUPS, encode_send_params
+
+class FakeStreamResponse(io.BytesIO):
+    """File-like HTTP response stub for stream-parsing tests"""
+
+    def __init__(self, body, headers=None):
+        super().__init__(body)
+        self.headers = headers or {}
 
 class BulkSMSTest(unittest.TestCase):
 
@@ -27,6 +52,97 @@ class BulkSMSTest(unittest.TestCase):
             BulkSMS('tokid', 'tokpass', routing_group='foogroup')
         self.assertIn('routing_group', str(err.exception))
 
+    def test_constructor_fails_invalid_transport(self):
+        """Constructor raises if transport is unknown"""
+        with self.assertRaises(ValueError) as err:
+            BulkSMS('tokid', 'tokpass', transport='carrier-pigeon')
+        self.assertIn('transport', str(err.exception))
+
+    @unittest.skipUnless(urllib3, "urllib3 not installed")
+    def test_send_pooled_transport(self):
+        """send() with 'pool' transport queries API through the connection pool"""
+        with mock.patch('bulksms.api.urllib3.PoolManager') as mpool:
+            mresp = mock.Mock(status=201, data=b'[{"id": "68953asd"}]')
+            mpool.return_value.request.return_value = mresp
+            bsms = BulkSMS('ti', 'ts', transport='pool')
+            res = bsms.send(['1234'], 'My msg')
+            self.assertEqual(['68953asd'], res)
+            self.assertEqual(1, mpool.return_value.request.call_count)
+            headers = mpool.return_value.request.call_args.kwargs['headers']
+            want_auth = base64.b64encode(b'ti:ts').decode()
+            self.assertEqual(f'Basic {want_auth}', headers['Authorization'])
+
+    @unittest.skipUnless(urllib3, "urllib3 not installed")
+    def test_send_pooled_transport_raises_urllib_error(self):
+        """send() with 'pool' transport raises urllib.error.URLError upon network failure"""
+        with mock.patch('bulksms.api.urllib3.PoolManager') as mpool:
+            mpool.return_value.request.side_effect = urllib3.exceptions.HTTPError("Bad network error")
+            bsms = BulkSMS('ti', 'ts', transport='pool')
+            with self.assertRaises(urllib.error.URLError) as err:
+                bsms.send(['1234'], 'My msg')
+            self.assertIn('Bad network error', str(err.exception))
+
+    @unittest.skipUnless(httpx, "httpx not installed")
+    def test_send_http2_transport(self):
+        """send() with 'http2' transport queries API through the multiplexing client"""
+        with mock.patch('bulksms.api.httpx.Client') as mcli:
+            mresp = mock.Mock(status_code=201, content=b'[{"id": "68953asd"}]')
+            mcli.return_value.request.return_value = mresp
+            bsms = BulkSMS('ti', 'ts', transport='http2')
+            res = bsms.send(['1234'], 'My msg')
+            self.assertEqual(['68953asd'], res)
+            self.assertEqual(1, mcli.return_value.request.call_count)
+            want_auth = base64.b64encode(b'ti:ts').decode()
+            self.assertEqual(f'Basic {want_auth}', mcli.call_args.kwargs['headers']['Authorization'])
+
+    @unittest.skipUnless(httpx, "httpx not installed")
+    def test_send_http2_transport_raises_urllib_error(self):
+        """send() with 'http2' transport raises urllib.error.URLError upon network failure"""
+        with mock.patch('bulksms.api.httpx.Client') as mcli:
+            mcli.return_value.request.side_effect = httpx.HTTPError("Bad network error")
+            bsms = BulkSMS('ti', 'ts', transport='http2')
+            with self.assertRaises(urllib.error.URLError) as err:
+                bsms.send(['1234'], 'My msg')
+            self.assertIn('Bad network error', str(err.exception))
+
+    def test_send_lowlevel_transport(self):
+        """send() with 'lowlevel' transport queries API through the cached connection"""
+        with mock.patch('bulksms.api.http.client.HTTPSConnection') as mconn:
+            mresp = mock.Mock(status=201)
+            mresp.read.return_value = b'[{"id": "68953asd"}]'
+            mconn.return_value.getresponse.return_value = mresp
+            bsms = BulkSMS('ti', 'ts', transport='lowlevel')
+            res = bsms.send(['1234'], 'My msg')
+            self.assertEqual(['68953asd'], res)
+            self.assertEqual(1, mconn.return_value.request.call_count)
+            method, path = mconn.return_value.request.call_args.args[:2]
+            self.assertEqual('POST', method)
+            self.assertEqual('/v1/messages', path)
+            headers = mconn.return_value.request.call_args.kwargs['headers']
+            want_auth = base64.b64encode(b'ti:ts').decode()
+            self.assertEqual(f'Basic {want_auth}', headers['Authorization'])
+
+    def test_send_lowlevel_transport_reconnects_once(self):
+        """send() with 'lowlevel' transport retries once when the idle connection dropped"""
+        with mock.patch('bulksms.api.http.client.HTTPSConnection') as mconn:
+            mresp = mock.Mock(status=201)
+            mresp.read.return_value = b'[{"id": "68953asd"}]'
+            mconn.return_value.request.side_effect = [http.client.BadStatusLine(''), None]
+            mconn.return_value.getresponse.return_value = mresp
+            bsms = BulkSMS('ti', 'ts', transport='lowlevel')
+            res = bsms.send(['1234'], 'My msg')
+            self.assertEqual(['68953asd'], res)
+            self.assertEqual(2, mconn.return_value.request.call_count)
+
+    def test_send_lowlevel_transport_raises_urllib_error(self):
+        """send() with 'lowlevel' transport raises urllib.error.URLError upon network failure"""
+        with mock.patch('bulksms.api.http.client.HTTPSConnection') as mconn:
+            mconn.return_value.request.side_effect = OSError("Bad network error")
+            bsms = BulkSMS('ti', 'ts', transport='lowlevel')
+            with self.assertRaises(urllib.error.URLError) as err:
+                bsms.send(['1234'], 'My msg')
+            self.assertIn('Bad network error', str(err.exception))
+
     def test_constructor_takes_routing_group_envvar(self):
         """Constructor takes routing group from envvar"""
         with mock.patch('bulksms.api.getenv') as menv:
@@ -57,6 +173,20 @@ class BulkSMSTest(unittest.TestCase):
         self.assertEqual('asd', bsms.get_sender('asd'))
         self.assertEqual('Asd', bsms.get_sender(' Asd  '))
 
+    def test_encode_send_params_matches_json_dumps(self):
+        """encode_send_params() produces the same bytes as the stdlib serializer"""
+        for params in [
+            {'to': ['+1234'], 'encoding': 'TEXT', 'body': 'My msg'},
+            {'to': ['+1234', '+4985656335'], 'encoding': 'UNICODE', 'body': '🙂 "quoted" \\ text', 'routingGroup': 'PREMIUM', 'from': 'sender321'},
+            {'to': [], 'encoding': 'TEXT', 'body': ''},
+        ]:
+            self.assertEqual(json.dumps(params).encode(), encode_send_params(params))
+
+    def test_encode_send_params_falls_back_on_unexpected_schema(self):
+        """encode_send_params() defers unexpected value types to the generic serializer"""
+        params = {'to': ['+1234'], 'count': 3}
+        self.assertEqual(json.loads(encode_send_params(params)), params)
+
     def test_send_interface(self):
         """send() calls API Endpoint with expected auth headers and body data"""
         with mock.patch('bulksms.api.urllib.request.urlopen') as muop:
@@ -79,6 +209,16 @@ class BulkSMSTest(unittest.TestCase):
             self.assertEqual(["+1234"], jdata['to'])
             self.assertNotIn("routingGroup", jdata, msg="routingGroup requested to API even though no routing group preference expressed""")
 
+    def test_send_advertises_and_decodes_gzip(self):
+        """send() requests gzip-compressed responses and decompresses them"""
+        with mock.patch('bulksms.api.urllib.request.urlopen') as muop:
+            muop.return_value.__enter__.return_value.read.return_value = gzip.compress(b'[{"id": "68953asd"}]')
+            muop.return_value.__enter__.return_value.headers = {'Content-Encoding': 'gzip'}
+            bsms = BulkSMS('ti', 'ts')
+            res = bsms.send(['1234'], 'My msg')
+            self.assertEqual(['68953asd'], res)
+            self.assertEqual('gzip', muop.call_args.args[0].headers.get('Accept-encoding'))
+
     def test_send_accepts_single_recipient_str(self):
         """send() accepts a single recipient"""
         with mock.patch('bulksms.api.urllib.request.urlopen') as muop:
@@ -90,8 +230,9 @@ class BulkSMSTest(unittest.TestCase):
             self.assertIn('Authorization', muop.call_args.args[0].headers)
             want_auth = base64.b64encode(b'ti:ts').decode()
             self.assertEqual(f'Basic {want_auth}', muop.call_args.args[0].headers['Authorization'])
-            self.assertIn(b'"to": ["+1234"]', muop.call_args.args[0].data)
-            self.assertNotIn(b'"from":', muop.call_args.args[0].data)
+            jdata = json.loads(muop.call_args.args[0].data.decode())
+            self.assertEqual(["+1234"], jdata['to'])
+            self.assertNotIn("from", jdata)
 
     def test_send_autodetects_encoding(self):
         """send() automatically sets 'encoding' field for content type"""
@@ -195,6 +336,44 @@ class BulkSMSTest(unittest.TestCase):
                     bsms.msg_delivery_status('12345')
                 self.assertIn("Unable to parse", str(err.exception))
 
+    @unittest.skipUnless(ijson, "ijson not installed")
+    def test_msg_delivery_status_stream(self):
+        """msg_delivery_status_stream() extracts status while parsing the response stream"""
+        with mock.patch('bulksms.api.urllib.request.urlopen') as muop:
+            bsms = BulkSMS('ti', 'ts')
+            for result in ['ACCEPTED', 'SCHEDULED', 'SENT', 'DELIVERED', 'FAILED']:
+                answer = b'{"status": {"type": "%s"}}' % result.encode()
+                muop.return_value.__enter__.return_value = FakeStreamResponse(answer)
+                self.assertEqual(result, bsms.msg_delivery_status_stream('5544332211'))
+                muop.reset_mock()
+
+    @unittest.skipUnless(ijson, "ijson not installed")
+    def test_msg_delivery_status_stream_decodes_gzip(self):
+        """msg_delivery_status_stream() decompresses gzip-encoded response streams"""
+        with mock.patch('bulksms.api.urllib.request.urlopen') as muop:
+            bsms = BulkSMS('ti', 'ts')
+            answer = gzip.compress(b'{"status": {"type": "DELIVERED"}}')
+            muop.return_value.__enter__.return_value = FakeStreamResponse(answer, {'Content-Encoding': 'gzip'})
+            self.assertEqual('DELIVERED', bsms.msg_delivery_status_stream('5544332211'))
+
+    @unittest.skipUnless(ijson, "ijson not installed")
+    def test_msg_delivery_status_stream_raises_bad_response(self):
+        """msg_delivery_status_stream() raises when API response lacks a status type"""
+        with mock.patch('bulksms.api.urllib.request.urlopen') as muop:
+            bsms = BulkSMS('ti', 'ts')
+            muop.return_value.__enter__.return_value = FakeStreamResponse(b'{"status": {}}')
+            with self.assertRaises(ValueError) as err:
+                bsms.msg_delivery_status_stream('12345')
+            self.assertIn("Unable to parse", str(err.exception))
+
+    @unittest.skipIf(ijson, "ijson installed")
+    def test_msg_delivery_status_stream_requires_ijson(self):
+        """msg_delivery_status_stream() raises if ijson is not installed"""
+        bsms = BulkSMS('ti', 'ts')
+        with self.assertRaises(ValueError) as err:
+            bsms.msg_delivery_status_stream('12345')
+        self.assertIn('ijson', str(err.exception))
+
     def test_msg_cost(self):
         """msg_cost() returns API price value"""
         with mock.patch('bulksms.api.urllib.request.urlopen') as muop:
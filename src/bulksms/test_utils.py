@@ -0,0 +1,32 @@
+"""Testing logic for bulksms utility functions"""
+
+import unittest
+
+from bulksms.utils import normalize_recipient
+
+class NormalizeRecipientTest(unittest.TestCase):
+
+    """Test cases for normalize_recipient()"""
+
+    def test_numeric_recipient_extracts_digits(self):
+        """normalize_recipient() extracts digits from numeric recipients"""
+        self.assertEqual('+12328921200123', normalize_recipient('001 (232) 892-120 0123'))
+        self.assertEqual('+49123456789', normalize_recipient('+49123456789'))
+        self.assertEqual('+1234', normalize_recipient('1234'))
+
+    def test_numeric_recipient_strips_leading_zeros(self):
+        """normalize_recipient() drops international-call prefix zeros"""
+        self.assertEqual('+41791234567', normalize_recipient('0041 79 123 45 67'))
+
+    def test_numeric_recipient_drops_non_ascii(self):
+        """normalize_recipient() ignores non-ASCII characters in numeric recipients"""
+        self.assertEqual('+1234', normalize_recipient('12 34'))
+
+    def test_symbolic_recipient_strips_whitespace(self):
+        """normalize_recipient() only strips whitespace around symbolic recipients"""
+        self.assertEqual('MyCoolService.com', normalize_recipient(' MyCoolService.com  '))
+        self.assertEqual('213asd', normalize_recipient('213asd'))
+
+
+if __name__ == '__main__':
+    unittest.main()         # pragma: no cover
@@ -1,9 +1,20 @@
 """Utility functions for bulksms library"""
 
+import re
 import string
 import os
 from typing import Optional
 
+# letters identify a symbolic recipient; compiled once, .search exits at the first letter
+_ALPHA_RE = re.compile('[A-Za-z]')
+
+# maps ASCII letters to 0x01 and all other bytes to 0x00, so a translated
+# recipient is all-zero iff it holds no letter
+_LETTER_MASK = bytes.maketrans(bytes(range(256)), bytes(1 if chr(c) in string.ascii_letters else 0 for c in range(256)))
+
+# translation table deleting every ASCII character that is not a digit
+_NON_DIGITS = str.maketrans('', '', ''.join(chr(c) for c in range(128) if chr(c) not in string.digits))
+
 def getenv(k: str, v: Optional[str]=None) -> Optional[str]:
     """Wrapper for os.getenv for mocking"""
     return os.getenv(k, v)                                  # pragma: no cover
@@ -19,9 +30,14 @@ def normalize_recipient(recipient: str) -> str:
 
     :param
     """
-    if set(recipient) & set(string.ascii_letters):
-        # symbolic recipient, not numeric => strip only
-        return recipient.strip()
-    recipient = ''.join(d for d in recipient if d in string.digits)
+    if recipient.isascii():
+        if any(recipient.encode().translate(_LETTER_MASK)):
+            # symbolic recipient, not numeric => strip only
+            return recipient.strip()
+    else:
+        if _ALPHA_RE.search(recipient):
+            return recipient.strip()
+        recipient = recipient.encode('ascii', errors='ignore').decode()
+    recipient = recipient.translate(_NON_DIGITS)
     return '+' + recipient.lstrip('0')
 